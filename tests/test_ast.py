@@ -0,0 +1,230 @@
+"""AST tests for xCDN."""
+
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from xcdn.ast import Annotation, Document, Node, Tag, Int, Float, String, Null, Array, Object
+from xcdn import ast, parse_str, ser
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+def test_ast_instances_have_no_dict():
+    """Test that AST instances are slotted."""
+    doc = parse_str("{ a: [1, 2], b: { c: null } }")
+    root = doc.values[0]
+    assert not hasattr(doc, "__dict__")
+    assert not hasattr(root, "__dict__")
+    assert not hasattr(root.value, "__dict__")
+    assert not hasattr(root["a"].value, "__dict__")
+    assert not hasattr(Node.new(Int(1)).value, "__dict__")
+
+
+def test_document_root_cache_follows_index_assignment():
+    """Test that replacing the first value refreshes the cached root object."""
+    doc = parse_str("a: 1")
+    assert "a" in doc
+    assert doc["a"].value.value == 1
+    doc[0] = Object()
+    assert "a" not in doc
+    doc["b"] = Int(2)
+    assert doc.values[0]["b"].value.value == 2
+
+
+def test_node_delegation_errors_come_from_value():
+    """Test that unsupported delegated methods raise AttributeError."""
+    node = Node.new(Int(1))
+    with pytest.raises(AttributeError):
+        node.get("x")
+    with pytest.raises(AttributeError):
+        parse_str("{ a: 1 }").values[0].append(Int(2))
+
+
+def test_field_names_match_dataclass_fields():
+    """Test the precomputed field name tuples."""
+    assert Node._FIELD_NAMES == ("value", "tags", "annotations")
+    assert Node(Int(1)).tags == ()
+    assert Object._FIELD_NAMES == ()
+    assert Array._FIELD_NAMES == ()
+    assert Document._FIELD_NAMES == ("prolog", "values")
+
+
+def test_node_new_shares_empty_decorations():
+    """Test that undecorated nodes share empty decorations until tagged."""
+    a = Node.new(Int(1))
+    b = Node.new(Int(2))
+    assert a.tags == () and a.tags is b.tags
+    a.add_tag(Tag("t"))
+    a.add_annotation(Annotation("mime"))
+    assert [t.name for t in a.tags] == ["t"]
+    assert [x.name for x in a.annotations] == ["mime"]
+    assert b.tags == () and b.annotations == ()
+
+
+def test_object_is_a_dict_of_nodes():
+    """Test that Object behaves as a dict and wraps raw values."""
+    obj = Object()
+    obj["a"] = Int(1)
+    assert isinstance(obj, dict)
+    assert obj.value is obj
+    assert isinstance(obj["a"], Node)
+    assert list(obj) == ["a"] and len(obj) == 1
+    assert obj.get("missing", 0) == 0
+    assert [n.value for n in obj.values_iter()] == [Int(1)]
+
+
+def test_array_is_a_list_of_nodes():
+    """Test that Array behaves as a list and wraps raw values."""
+    arr = Array()
+    arr.append(Int(1))
+    arr.append(Node.new(Int(2)))
+    arr[0] = Int(3)
+    assert isinstance(arr, list)
+    assert arr.value is arr
+    assert [n.value for n in arr] == [Int(3), Int(2)]
+    assert len(arr) == 2 and str(arr) == "[2 items]"
+
+
+def test_scalars_compare_and_freeze_like_dataclasses():
+    """Test equality, repr and immutability of the hand-written scalars."""
+    assert Int(1) == Int(1) and Int(1) != Float(1)
+    assert Null() == Null() and hash(Int(3)) == hash(Int(3))
+    assert repr(String("a")) == "String(value='a')"
+    with pytest.raises(FrozenInstanceError):
+        Int(1).value = 2
+    f = Float(1.5)
+    f.value = 2.5
+    assert f == Float(2.5)
+
+
+def test_nodes_and_documents_compare_by_identity():
+    """Test identity equality on Node and Document."""
+    a = Node.new(Int(1))
+    assert a == a and a != Node.new(Int(1))
+    assert a in [Node.new(Int(1)), a]
+    assert Document.new() != Document.new()
+    assert repr(a) == "Node(value=Int(value=1))"
+
+
+def test_document_release_recycles_nodes():
+    """Test that released nodes are reused by Node.new."""
+    doc = parse_str('$v: [1], a: { b: [1, 2] }, c: @x([3]) 4')
+    inner = doc["a"].value
+    node = doc["c"]
+    shared = Node.new(Int(5))
+    doc["d"] = shared
+    doc["e"] = shared
+    ast._FREE_LIST.clear()
+    doc.release()
+    assert doc.values == [] and doc.prolog == []
+    assert len(inner) == 0
+    assert node in ast._FREE_LIST
+    assert ast._FREE_LIST.count(shared) == 1
+    assert len(ast._FREE_LIST) == 9
+    assert node.value is ast._NULL and node.annotations == ()
+    recycled = ast._FREE_LIST[-1]
+    reused = Node.new(Int(1))
+    assert reused is recycled and reused.value == Int(1)
+    assert len(ast._FREE_LIST) == 8
+    ast._FREE_LIST.clear()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+def test_node_slot_layout_puts_value_first():
+    """Test that the hot `value` field occupies the first slot."""
+    assert Node.__slots__ == ("value", "tags", "annotations")
+
+
+def test_object_keys_are_interned_only_when_exact_str():
+    """Test that non-str and str-subclass keys are stored unchanged."""
+    class Key(str):
+        pass
+
+    obj = Object()
+    obj[Key("k")] = Int(1)
+    obj[3] = Int(2)
+    obj["host " + "name"] = Int(3)
+    assert type(next(iter(obj))) is Key
+    assert obj[3].value == Int(2)
+    assert next(k for k in obj if k == "host name") is sys.intern("host name")
+
+
+def test_document_root_cache_follows_direct_values_edits():
+    """Test that editing `values` directly never leaves a stale root."""
+    doc = parse_str("{a: 1}")
+    assert "a" in doc
+    doc.values.clear()
+    doc["b"] = Int(2)
+    assert len(doc.values) == 1 and doc.values[0]["b"].value == Int(2)
+    assert "a" not in doc
+    doc.values[0].value = Object()
+    assert "b" not in doc
+    doc.values[0] = Node.new(Int(3))
+    assert "b" not in doc
+    with pytest.raises(KeyError):
+        doc["b"]
+
+
+def test_object_bulk_writes_wrap_values():
+    """Test that dict write methods wrap raw values so they serialize."""
+    doc = parse_str("{a: 1}")
+    obj = doc.values[0].value
+    obj.update({"b": Int(2)}, c=Int(3))
+    obj.update([("d", Int(4))])
+    assert obj.setdefault("e", Int(5)).value == Int(5)
+    assert obj.setdefault("a", Int(9)).value == Int(1)
+    obj |= {"f": Int(6)}
+    merged = obj | {"g": Int(7)}
+    assert type(obj.copy()) is Object and type(merged) is Object
+    assert all(isinstance(n, Node) for n in merged.values())
+    assert ser.to_string_compact(doc) == "{a: 1,b: 2,c: 3,d: 4,e: 5,f: 6}"
+
+
+def test_array_bulk_writes_wrap_values():
+    """Test that list write methods wrap raw values so they serialize."""
+    doc = parse_str("[1]")
+    arr = doc.values[0].value
+    arr.extend([Int(3)])
+    arr.insert(1, Int(2))
+    arr += [Int(4)]
+    arr[4:] = [Int(5)]
+    joined = arr + [Int(6)]
+    assert type(arr.copy()) is Array and type(joined) is Array
+    assert all(isinstance(n, Node) for n in joined)
+    assert ser.to_string_compact(doc) == "[1,2,3,4,5]"
+
+
+def _walk(obj, seen):
+    """Generic `_FIELD_NAMES` walker, descending into mappings and sequences."""
+    seen.append(obj)
+    for name in getattr(type(obj), "_FIELD_NAMES", ()):
+        _walk(getattr(obj, name), seen)
+    if isinstance(obj, dict):
+        for child in obj.values():
+            _walk(child, seen)
+    elif isinstance(obj, (list, tuple)):
+        for child in obj:
+            _walk(child, seen)
+    return seen
+
+
+def test_field_names_walker_terminates_on_nested_document():
+    """Test that a `_FIELD_NAMES` walker visits every node exactly once."""
+    doc = parse_str('{a: {b: [1, [2]]}, c: "x"}')
+    seen = _walk(doc, [])
+    assert sum(isinstance(o, Node) for o in seen) == 7
+    assert sum(isinstance(o, Object) for o in seen) == 2
+    assert sum(isinstance(o, Array) for o in seen) == 2
+
+
+def test_document_release_resets_nodes_shared_with_another_document():
+    """Test that a node aliased into another document is visibly reset."""
+    doc1 = parse_str("x: 1")
+    doc2 = parse_str("y: 2")
+    doc2["x"] = doc1["x"]
+    ast._FREE_LIST.clear()
+    doc1.release()
+    assert doc2["x"].value is ast._NULL
+    assert ser.to_string_compact(doc2) == "{y: 2,x: null}"
+    ast._FREE_LIST.clear()
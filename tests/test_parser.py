@@ -1,5 +1,7 @@
 """Parser tests for xCDN."""
 
+import sys
+
 from xcdn.ast import String, Int, Bool, Object, Array
 from xcdn.error import Expected
 from xcdn import parse_str
@@ -84,3 +86,37 @@ def test_parse_reports_missing_colon():
         assert False, "Should have raised an error"
     except Exception as e:
         assert isinstance(e.kind, Expected)
+
+
+def test_parse_interns_keys_and_names():
+    """Test that object keys and decoration names are interned."""
+    doc = parse_str('$schema: "s", cfg: { "host name": #user @mime("x") 1 }')
+    obj = doc.values[0].value
+    key = next(iter(obj["cfg"].value.keys()))
+    assert key is sys.intern("host name")
+    node = obj["cfg"]["host name"]
+    assert node.tags[0].name is sys.intern("user")
+    assert node.annotations[0].name is sys.intern("mime")
+    assert doc.prolog[0].name is sys.intern("schema")
+
+
+def test_parse_shares_scalar_flyweights():
+    """Test that null, booleans and small ints are shared instances."""
+    doc = parse_str("[null, null, true, true, false, 7, 7, 100000, 100000]")
+    arr = doc.values[0].value
+    values = [n.value for n in arr]
+    assert values[0] is values[1]
+    assert values[2] is values[3] and values[2].value is True
+    assert values[4].value is False
+    assert values[5] is values[6]
+    assert values[7] == values[8] and values[7] is not values[8]
+
+
+def test_parse_undecorated_nodes_share_empty_decorations():
+    """Test that only decorated nodes get their own tag/annotation lists."""
+    doc = parse_str("{ a: 1, b: #t 2 }")
+    obj = doc.values[0].value
+    assert obj["a"].tags == () and obj["a"].annotations == ()
+    assert obj["a"].tags is doc.values[0].tags
+    assert [t.name for t in obj["b"].tags] == ["t"]
+    assert obj["b"].annotations == ()
@@ -1,6 +1,7 @@
 """Serialization tests for xCDN."""
 
 from xcdn import parse_str, ser
+from xcdn.ast import ValueKind, _VALUE_TYPES
 
 
 def test_serialize_roundtrip_pretty_and_compact():
@@ -43,3 +44,9 @@ def test_serialize_strings_and_escapes():
     assert "\\n" in s
     assert '\\"' in s
     assert "\\\\" in s
+
+
+def test_serializer_covers_every_value_type():
+    """Test that every AST value type has a writer at its kind."""
+    assert len(ser._VALUE_WRITERS) == len(ValueKind)
+    assert sorted(cls.KIND for cls in _VALUE_TYPES) == list(ValueKind)
@@ -4,314 +4,633 @@ The AST is intentionally decoupled from parsing/serialization so it can be
 constructed or consumed programmatically.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Union
+from dataclasses import FrozenInstanceError, dataclass, field, fields, is_dataclass
+from typing import (
+    Any, ClassVar, Dict, ItemsView, Iterable, Iterator, KeysView, List,
+    Mapping, Optional, Sequence, Tuple, Union, ValuesView,
+)
 from decimal import Decimal
+from enum import IntEnum
 from datetime import datetime
 from uuid import UUID
+import sys
 
+# `slots=True` is only understood by dataclasses on Python 3.10+; older
+# interpreters fall back to regular instances with a `__dict__`.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern_key(key: Any) -> Any:
+    """Intern exact `str` keys; str subclasses and other keys pass through."""
+    return sys.intern(key) if type(key) is str else key
+
+
+# Shared by undecorated nodes in place of two fresh empty lists.
+_EMPTY: Tuple[()] = ()
+_new_object = object.__new__
+
+# Nodes handed back by `Document.release()`, reused by `Node.new`. Bounded so
+# a single huge document cannot pin memory forever.
+_FREE_LIST: List['Node'] = []
+_FREE_LIST_MAX = 8192
+
+
+@dataclass(eq=False, repr=False, **_SLOTS)
 class Document:
-    """This struct represent a whole xCDN document."""
+    """This struct represent a whole xCDN document. Documents compare by identity.
+
+    String-key access caches the root `Object` (the first value) in `_root`;
+    each access checks by identity that it is still `values[0].value`, so
+    edits made directly to `values` are picked up.
+    """
     prolog: List['Directive'] = field(default_factory=list)
     values: List['Node'] = field(default_factory=list)
+    _root: Optional['Object'] = field(default=None, init=False, repr=False, compare=False)
 
     @staticmethod
     def new() -> 'Document':
         """Construct an empty document."""
         return Document()
 
-    def __getitem__(self, key: Union[str, int]):
+    def __repr__(self) -> str:
+        return f"Document(prolog={self.prolog!r}, values={self.values!r})"
+
+    def release(self) -> None:
+        """Recycle this document's nodes for later `Node.new` calls.
+
+        Useful when many documents are parsed in a row. The document, and
+        every Object and Array inside it, is emptied, and each recycled node
+        is reset to the shared `Null`.
+
+        Nodes taken from the document must not be used afterwards. That
+        includes nodes that were also placed in another document (e.g.
+        `other["x"] = doc["x"]`): they are recycled as well, so they read
+        as `null` in the other document, and the next `Node.new` call will
+        silently overwrite them there. Copy such values into fresh nodes
+        before releasing.
+        """
+        seen = set()
+        nodes = list(self.values)
+        values = [d.value for d in self.prolog]
+        while nodes or values:
+            while nodes:
+                n = nodes.pop()
+                if n in seen:
+                    continue
+                seen.add(n)
+                values.append(n.value)
+                for a in n.annotations:
+                    values.extend(a.args)
+                if len(_FREE_LIST) < _FREE_LIST_MAX:
+                    n.value = _NULL
+                    n.tags = _EMPTY
+                    n.annotations = _EMPTY
+                    _FREE_LIST.append(n)
+            while values:
+                v = values.pop()
+                if isinstance(v, Object):
+                    nodes.extend(dict.values(v))
+                    dict.clear(v)
+                elif isinstance(v, Array):
+                    nodes.extend(v)
+                    list.clear(v)
+        self.prolog = []
+        self.values = []
+        self._root = None
+
+    def _refresh_root(self) -> Optional['Object']:
+        """Re-read the root `Object` from `values` (slow path of the cache)."""
+        vals = self.values
+        root = vals[0].value if vals else None
+        self._root = root if isinstance(root, Object) else None
+        return self._root
+
+    def __getitem__(self, key: Union[str, int]) -> 'Node':
         """Access document values directly.
         
         If key is int: access by index in values list.
         If key is str: access first value as object and get the key.
         """
-        if isinstance(key, int):
+        if isinstance(key, str):
+            vals = self.values
+            root = self._root
+            if root is None or not vals or vals[0].value is not root:
+                # Assume first value is an Object and get the key from it
+                root = self._refresh_root()
+                if root is None:
+                    raise KeyError(f"Cannot access key '{key}' on document")
+            return root[key]
+        elif isinstance(key, int):
             return self.values[key]
-        elif isinstance(key, str):
-            # Assume first value is an Object and get the key from it
-            if self.values and isinstance(self.values[0].value, Object):
-                return self.values[0].value[key]
-            raise KeyError(f"Cannot access key '{key}' on document")
         raise TypeError(f"Document indices must be integers or strings, not {type(key).__name__}")
 
-    def __setitem__(self, key: Union[str, int], value):
+    def __setitem__(self, key: Union[str, int], value: Any) -> None:
         """Set document values directly."""
-        if isinstance(key, int):
+        if isinstance(key, str):
+            vals = self.values
+            root = self._root
+            if root is None or not vals or vals[0].value is not root:
+                # Ensure first value is an Object
+                if not vals:
+                    vals.append(Node.new(Object()))
+                root = self._refresh_root()
+                if root is None:
+                    raise TypeError("First document value is not an Object")
+            root[key] = value
+        elif isinstance(key, int):
             self.values[key] = value if isinstance(value, Node) else Node.new(value)
-        elif isinstance(key, str):
-            # Ensure first value is an Object
-            if not self.values:
-                self.values.append(Node.new(Object()))
-            if isinstance(self.values[0].value, Object):
-                self.values[0].value[key] = value
-            else:
-                raise TypeError("First document value is not an Object")
         else:
             raise TypeError(f"Document indices must be integers or strings, not {type(key).__name__}")
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists in first object value."""
-        if self.values and isinstance(self.values[0].value, Object):
-            return key in self.values[0].value
-        return False
+        vals = self.values
+        root = self._root
+        if root is None or not vals or vals[0].value is not root:
+            root = self._refresh_root()
+            if root is None:
+                return False
+        return key in root
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Directive:
     """A prolog directive, e.g. `$schema: "..."`."""
     name: str  # without the leading '$'
     value: 'Value'
 
 
-@dataclass
+@dataclass(eq=False, repr=False, **_SLOTS)
 class Node:
-    """A value enriched with optional `#tags` and `@annotations`."""
-    tags: List['Tag'] = field(default_factory=list)
-    annotations: List['Annotation'] = field(default_factory=list)
-    value: 'Value' = None
+    """A value enriched with optional `#tags` and `@annotations`.
+
+    Undecorated nodes share one empty tuple for `tags` and `annotations`;
+    `add_tag`/`add_annotation` swap in a real list on first use. Nodes
+    compare by identity.
+    """
+    # Field order is slot order: `value` is read on every access, so it
+    # goes first, ahead of the rarely populated decorations.
+    value: 'Value'
+    tags: Sequence['Tag'] = _EMPTY
+    annotations: Sequence['Annotation'] = _EMPTY
 
     @staticmethod
     def new(value: 'Value') -> 'Node':
-        return Node(value=value)
+        """Construct an undecorated node, skipping the generated `__init__`.
 
-    def __getitem__(self, key: Union[str, int]):
+        Nodes released by `Document.release()` are reused when available.
+        """
+        if _FREE_LIST:
+            try:
+                n = _FREE_LIST.pop()
+            except IndexError:  # emptied by another thread since the check
+                n = _new_object(Node)
+        else:
+            n = _new_object(Node)
+        n.value = value
+        n.tags = _EMPTY
+        n.annotations = _EMPTY
+        return n
+
+    def __repr__(self) -> str:
+        if self.tags or self.annotations:
+            return f"Node(value={self.value!r}, tags={self.tags!r}, annotations={self.annotations!r})"
+        return f"Node(value={self.value!r})"
+
+    def add_tag(self, tag: 'Tag') -> None:
+        """Append a tag, replacing a shared empty tuple with a list."""
+        tags = self.tags
+        if isinstance(tags, list):
+            tags.append(tag)
+        else:
+            self.tags = [*tags, tag]
+
+    def add_annotation(self, annotation: 'Annotation') -> None:
+        """Append an annotation, replacing a shared empty tuple with a list."""
+        annotations = self.annotations
+        if isinstance(annotations, list):
+            annotations.append(annotation)
+        else:
+            self.annotations = [*annotations, annotation]
+
+    # Special methods are resolved on the type, so they cannot be bound per
+    # instance; each delegator below is one frame over the dict/list slot of
+    # `Object`/`Array`. `value` is read into an `Any` local: which operations
+    # it supports depends on the wrapped type, checked at runtime.
+    def __getitem__(self, key: Union[str, int]) -> 'Node':
         """Delegate item access to the underlying value."""
-        return self.value[key]
+        v: Any = self.value
+        return v[key]
 
-    def __setitem__(self, key: Union[str, int], value):
+    def __setitem__(self, key: Union[str, int], value: Any) -> None:
         """Delegate item setting to the underlying value."""
-        self.value[key] = value
+        v: Any = self.value
+        v[key] = value
 
     def __contains__(self, key: Union[str, int]) -> bool:
         """Delegate containment check to the underlying value."""
-        return key in self.value
+        v: Any = self.value
+        return key in v
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Any]:
         """Delegate iteration to the underlying value."""
-        return iter(self.value)
+        v: Any = self.value
+        return iter(v)
 
     def __len__(self) -> int:
         """Delegate length to the underlying value."""
-        return len(self.value)
+        v: Any = self.value
+        return len(v)
 
-    def get(self, key: str, default=None):
+    def get(self, key: str, default: Any = None) -> Any:
         """Delegate get() to the underlying value (for Object types)."""
-        if hasattr(self.value, 'get'):
-            return self.value.get(key, default)
-        raise AttributeError(f"'{type(self.value).__name__}' object has no attribute 'get'")
+        v: Any = self.value
+        return v.get(key, default)
 
-    def keys(self):
+    def keys(self) -> KeysView[str]:
         """Delegate keys() to the underlying value (for Object types)."""
-        if hasattr(self.value, 'keys'):
-            return self.value.keys()
-        raise AttributeError(f"'{type(self.value).__name__}' object has no attribute 'keys'")
+        v: Any = self.value
+        return v.keys()
 
-    def values_iter(self):
+    def values_iter(self) -> ValuesView['Node']:
         """Delegate values_iter() to the underlying value (for Object types)."""
-        if hasattr(self.value, 'values_iter'):
-            return self.value.values_iter()
-        raise AttributeError(f"'{type(self.value).__name__}' object has no attribute 'values_iter'")
+        v: Any = self.value
+        return v.values_iter()
 
-    def items(self):
+    def items(self) -> ItemsView[str, 'Node']:
         """Delegate items() to the underlying value (for Object types)."""
-        if hasattr(self.value, 'items'):
-            return self.value.items()
-        raise AttributeError(f"'{type(self.value).__name__}' object has no attribute 'items'")
+        v: Any = self.value
+        return v.items()
 
-    def append(self, value):
+    def append(self, value: Any) -> None:
         """Delegate append() to the underlying value (for Array types)."""
-        if hasattr(self.value, 'append'):
-            return self.value.append(value)
-        raise AttributeError(f"'{type(self.value).__name__}' object has no attribute 'append'")
+        v: Any = self.value
+        v.append(value)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Tag:
     """A tag like #demotag"""
     name: str
 
-    def __hash__(self):
+    def __hash__(self) -> int:
         return hash(self.name)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Annotation:
     """An annotation like `@mime("image/png")`."""
     name: str
     args: List['Value'] = field(default_factory=list)
 
 
+class ValueKind(IntEnum):
+    """Dense tag for each concrete value type, stored as `KIND` on the class.
+
+    Consumers can dispatch with one attribute load and a list index instead
+    of a chain of `isinstance` checks.
+    """
+    NULL = 0
+    BOOL = 1
+    INT = 2
+    FLOAT = 3
+    DECIMAL = 4
+    STRING = 5
+    BYTES = 6
+    DATETIME = 7
+    DURATION = 8
+    UUID = 9
+    ARRAY = 10
+    OBJECT = 11
+
+
 class ValueType:
     """Base class for all value types."""
-    pass
+    __slots__ = ()
+
+
+class _Scalar(ValueType):
+    """Base for single-`value` leaf types.
+
+    Written by hand rather than with `@dataclass`: these are allocated once
+    per scalar token, and a plain `__init__` is the cheapest constructor.
+    Equality and `repr` match what the dataclass versions generated.
+    """
+    __slots__ = ('value',)
+    __match_args__ = ('value',)
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.value == other.value
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(value={self.value!r})"
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
+
+
+# Writes the `value` slot directly, bypassing `_FrozenScalar.__setattr__`;
+# cheaper than going through `object.__setattr__`.
+_set_scalar_value = getattr(_Scalar, 'value').__set__
+
+
+class _FrozenScalar(_Scalar):
+    """Immutable (and hashable) `_Scalar`, so instances can be shared."""
+    __slots__ = ()
+
+    def __init__(self, value: Any) -> None:
+        _set_scalar_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __hash__(self) -> int:
+        return hash((self.value,))
 
 
-@dataclass
 class Null(ValueType):
-    """Null value."""
-    def __str__(self):
+    """Null value. Immutable, so the parser shares one instance."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.NULL
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return True
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(())
+
+    def __repr__(self) -> str:
+        return "Null()"
+
+    def __str__(self) -> str:
         return "null"
 
 
-@dataclass
-class Bool(ValueType):
-    """Boolean value."""
+class Bool(_FrozenScalar):
+    """Boolean value. Immutable, so the parser shares `true`/`false` instances."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.BOOL
     value: bool
 
-    def __str__(self):
+    def __str__(self) -> str:
         return str(self.value).lower()
 
 
-@dataclass
-class Int(ValueType):
-    """Integer value."""
+class Int(_FrozenScalar):
+    """Integer value. Immutable, so the parser shares small-integer instances."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.INT
     value: int
 
-    def __str__(self):
+    def __str__(self) -> str:
         return str(self.value)
 
 
-@dataclass
-class Float(ValueType):
+class Float(_Scalar):
     """Float value."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.FLOAT
     value: float
 
-    def __str__(self):
+    def __str__(self) -> str:
         return str(self.value)
 
 
-@dataclass
-class DecimalValue(ValueType):
+class DecimalValue(_Scalar):
     """Arbitrary-precision decimal. Serialized as `d"..."`."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.DECIMAL
     value: Decimal
 
-    def __str__(self):
+    def __str__(self) -> str:
         return str(self.value)
 
 
-@dataclass
-class String(ValueType):
+class String(_Scalar):
     """String value."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.STRING
     value: str
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.value
 
 
-@dataclass
-class Bytes(ValueType):
+class Bytes(_Scalar):
     """Bytes decoded from Base64 (standard or URL-safe). Serialized as `b"..."`."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.BYTES
     value: bytes
 
-    def __str__(self):
+    def __str__(self) -> str:
         return f"<{len(self.value)} bytes>"
 
 
-@dataclass
-class DateTime(ValueType):
+class DateTime(_Scalar):
     """RFC3339 datetime. Serialized as `t"..."`."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.DATETIME
     value: datetime
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.value.isoformat()
 
 
-@dataclass
-class Duration(ValueType):
+class Duration(_Scalar):
     """ISO8601 duration: `PnYnMnDTnHnMnS`. Serialized as `r"..."`."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.DURATION
     value: str  # We'll store as string for simplicity
 
-    def __str__(self):
+    def __str__(self) -> str:
         return "<duration>"
 
 
-@dataclass
-class Uuid(ValueType):
+class Uuid(_Scalar):
     """UUID v1-v8."""
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.UUID
     value: UUID
 
-    def __str__(self):
+    def __str__(self) -> str:
         return str(self.value)
 
 
-@dataclass
-class Array(ValueType):
-    """Array value."""
-    value: List[Node] = field(default_factory=list)
+class Array(ValueType, list):
+    """Array value.
 
-    def __str__(self):
-        return f"[{len(self.value)} items]"
+    The instance is itself the `list` of `Node`s; `value` returns the
+    array itself for code written against the old wrapper.
+    """
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.ARRAY
+    # No fields: `value` is the array itself, items are reached as a sequence.
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
 
-    def __getitem__(self, index: int):
-        """Access array items by index."""
-        return self.value[index]
+    def __init__(self, value: Optional[List[Node]] = None) -> None:
+        if value:
+            list.extend(self, value)
 
-    def __setitem__(self, index: int, value):
-        """Set array items by index."""
-        self.value[index] = value if isinstance(value, Node) else Node.new(value)
+    @classmethod
+    def _from_nodes(cls, nodes: Iterable[Node]) -> 'Array':
+        """Build an array from nodes in one call, skipping the wrap check."""
+        arr = list.__new__(cls)
+        list.extend(arr, nodes)
+        return arr
 
-    def __len__(self) -> int:
-        """Return array length."""
-        return len(self.value)
+    @property
+    def value(self) -> List[Node]:
+        """The list itself."""
+        return self
 
-    def __iter__(self):
-        """Iterate over array items."""
-        return iter(self.value)
+    def __repr__(self) -> str:
+        return f"Array(value={list.__repr__(self)})"
 
-    def append(self, value):
-        """Append value to array."""
-        self.value.append(value if isinstance(value, Node) else Node.new(value))
-
-
-@dataclass
-class Object(ValueType):
-    """An ordered map to preserve insertion order during roundtrips."""
-    value: Dict[str, Node] = field(default_factory=dict)
-
-    def __str__(self):
-        return f"{{{len(self.value)} entries}}"
+    def __str__(self) -> str:
+        return f"[{len(self)} items]"
 
-    def __getitem__(self, key: str):
-        """Access object values by key."""
-        return self.value[key]
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Set array items by index or slice."""
+        if isinstance(index, slice):
+            list.__setitem__(self, index, [v if isinstance(v, Node) else Node.new(v) for v in value])
+        else:
+            list.__setitem__(self, index, value if isinstance(value, Node) else Node.new(value))
 
-    def __setitem__(self, key: str, value):
+    def append(self, value: Any) -> None:
+        """Append value to array."""
+        list.append(self, value if isinstance(value, Node) else Node.new(value))
+
+    def insert(self, index: Any, value: Any) -> None:
+        """Insert value before `index`."""
+        list.insert(self, index, value if isinstance(value, Node) else Node.new(value))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append every value, wrapping like `append`."""
+        list.extend(self, [v if isinstance(v, Node) else Node.new(v) for v in values])
+
+    def copy(self) -> 'Array':
+        """Shallow copy that stays an `Array`."""
+        return type(self)._from_nodes(self)
+
+    def __add__(self, other: Any) -> Any:
+        if not isinstance(other, list):
+            return NotImplemented
+        new = self.copy()
+        new.extend(other)
+        return new
+
+    def __iadd__(self, other: Any) -> 'Array':
+        self.extend(other)
+        return self
+
+
+class Object(ValueType, dict):
+    """An ordered map to preserve insertion order during roundtrips.
+
+    The instance is itself the `dict` of keys to `Node`s, so lookups,
+    iteration and `len()` go straight to the C implementation. `value`
+    returns the object itself for code written against the old wrapper.
+    """
+    __slots__ = ()
+    KIND: ClassVar[ValueKind] = ValueKind.OBJECT
+    # No fields: `value` is the object itself, entries are reached as a mapping.
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, value: Optional[Dict[str, Node]] = None) -> None:
+        if value:
+            dict.update(self, value)
+
+    @classmethod
+    def _from_nodes(cls, pairs: Union[Mapping[str, Node], Iterable[Tuple[str, Node]]]) -> 'Object':
+        """Build an object from `(key, Node)` pairs in one call, skipping per-key checks."""
+        obj = dict.__new__(cls)
+        dict.update(obj, pairs)
+        return obj
+
+    @property
+    def value(self) -> Dict[str, Node]:
+        """The mapping itself."""
+        return self
+
+    def __repr__(self) -> str:
+        return f"Object(value={dict.__repr__(self)})"
+
+    def __str__(self) -> str:
+        return f"{{{len(self)} entries}}"
+
+    def __setitem__(self, key: str, value: Any) -> None:
         """Set object values by key."""
-        self.value[key] = value if isinstance(value, Node) else Node.new(value)
+        dict.__setitem__(self, _intern_key(key), value if isinstance(value, Node) else Node.new(value))
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        """Update from a mapping or pairs, wrapping values like `__setitem__`."""
+        if hasattr(other, 'keys'):
+            other = [(k, other[k]) for k in other.keys()]
+        for k, v in other:
+            self[k] = v
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def setdefault(self, key: str, default: Any = None) -> Node:
+        """Return the node at `key`, inserting a wrapped `default` if missing."""
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def copy(self) -> 'Object':
+        """Shallow copy that stays an `Object`."""
+        return type(self)._from_nodes(self)
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ior__(self, other: Any) -> 'Object':
+        self.update(other)
+        return self
+
+    def values_iter(self) -> ValuesView[Node]:
+        """Return object values (renamed to avoid conflict with Node.value)."""
+        return dict.values(self)
 
-    def __contains__(self, key: str) -> bool:
-        """Check if key exists in object."""
-        return key in self.value
 
-    def __iter__(self):
-        """Iterate over object keys."""
-        return iter(self.value)
+# Flyweights for the most common scalars; safe to share because the
+# classes are frozen.
+_NULL = Null()
+_TRUE = Bool(True)
+_FALSE = Bool(False)
+_INT_CACHE = {i: Int(i) for i in range(-5, 257)}
 
-    def __len__(self) -> int:
-        """Return number of entries."""
-        return len(self.value)
 
-    def get(self, key: str, default=None):
-        """Get value with default fallback."""
-        try:
-            return self.value[key]
-        except KeyError:
-            return default
+def make_null() -> Null:
+    """Return the shared `Null` instance."""
+    return _NULL
 
-    def keys(self):
-        """Return object keys."""
-        return self.value.keys()
 
-    def values_iter(self):
-        """Return object values (renamed to avoid conflict with Node.value)."""
-        return self.value.values()
+def make_bool(b: bool) -> Bool:
+    """Return the shared `Bool` instance for `b`."""
+    return _TRUE if b else _FALSE
 
-    def items(self):
-        """Return object items."""
-        return self.value.items()
+
+def make_int(i: int) -> Int:
+    """Return an `Int`, shared for values in [-5, 256]."""
+    n = _INT_CACHE.get(i)
+    return Int(i) if n is None else n
 
 
 # Type alias for convenience
@@ -319,3 +638,19 @@ Value = Union[
     Null, Bool, Int, Float, DecimalValue, String, Bytes,
     DateTime, Duration, Uuid, Array, Object
 ]
+
+# Runtime counterpart of `Value`, usable with a single `isinstance` call.
+_VALUE_TYPES = (
+    Null, Bool, Int, Float, DecimalValue, String, Bytes,
+    DateTime, Duration, Uuid, Array, Object,
+)
+
+
+# Field names per AST class, so generic walkers can enumerate attributes
+# without calling `dataclasses.fields()` on every visit. Private fields
+# (caches) are left out; non-dataclass types declare `_FIELD_NAMES` inline.
+for _cls in (Document, Directive, Node, Tag, Annotation) + _VALUE_TYPES:
+    if not is_dataclass(_cls):
+        continue
+    setattr(_cls, '_FIELD_NAMES', tuple(sys.intern(f.name) for f in fields(_cls) if not f.name.startswith('_')))
+del _cls
@@ -12,11 +12,13 @@ from decimal import Decimal
 from datetime import datetime
 from uuid import UUID
 import base64
+import sys
 
 from .ast import (
     Annotation, Directive, Document, Node, Tag,
     Null, Bool, Int, Float, DecimalValue, String, Bytes,
-    DateTime, Duration, Uuid, Array, Object
+    DateTime, Duration, Uuid, Array, Object,
+    make_null, make_bool, make_int
 )
 from .error import Error, ErrorKind, Span, Expected, Message, InvalidDecimal, InvalidUuid, InvalidDateTime, InvalidDuration
 from .lexer import Lexer, Token, TokenType
@@ -114,7 +116,7 @@ class Parser:
                     t = self.bump()
                     raise Error.new(Expected(expected="object key, ", found=tname), t.span)
 
-            doc.values.append(Node(annotations=[], tags=[], value=Object(value=obj_map)))
+            doc.values.append(Node.new(Object._from_nodes(obj_map)))
         elif peek_kind == TokenType.EOF:
             return doc
         else:
@@ -132,9 +134,9 @@ class Parser:
 
     def parse_node(self) -> Node:
         """Parse a node with optional decorations (tags and annotations)."""
-        # Gather decorations
-        annotations = []
-        tags = []
+        # Gather decorations; lists are only allocated for decorated values
+        annotations = None
+        tags = None
         while True:
             peek_kind = self.peek().kind
             if peek_kind == TokenType.AT:
@@ -159,32 +161,41 @@ class Parser:
                             else:
                                 t = self.bump()
                                 raise Error.new(Expected(expected='","or ")"', found=token_name(t.kind)), t.span)
+                if annotations is None:
+                    annotations = []
                 annotations.append(Annotation(name=name, args=args))
             elif peek_kind == TokenType.HASH:
                 self.bump()
                 name = self.parse_ident_string()
+                if tags is None:
+                    tags = []
                 tags.append(Tag(name=name))
             else:
                 break
 
         v = self.parse_value()
-        return Node(annotations=annotations, tags=tags, value=v)
+        if annotations is None and tags is None:
+            return Node.new(v)
+        return Node(annotations=annotations or (), tags=tags or (), value=v)
 
     def parse_ident_string(self) -> str:
-        """Parse an identifier."""
+        """Parse an identifier (interned: used for directive, tag and annotation names)."""
         t = self.bump()
         if t.kind == TokenType.IDENT:
-            return t.value
+            return sys.intern(t.value)
         else:
             raise Error.new(Expected(expected="identifier", found=token_name(t.kind)), t.span)
 
     def parse_key(self) -> str:
-        """Parse an object key (identifier or string)."""
+        """Parse an object key (identifier or string).
+
+        Keys are interned so repeated lookups compare by identity.
+        """
         t = self.bump()
         if t.kind == TokenType.IDENT:
-            return t.value
+            return sys.intern(t.value)
         elif t.kind == TokenType.STRING:
-            return t.value
+            return sys.intern(t.value)
         else:
             raise Error.new(Expected(expected="object key", found=token_name(t.kind)), t.span)
 
@@ -199,13 +210,13 @@ class Parser:
         elif t.kind in (TokenType.STRING, TokenType.TRIPLE_STRING):
             return String(value=t.value)
         elif t.kind == TokenType.TRUE:
-            return Bool(value=True)
+            return make_bool(True)
         elif t.kind == TokenType.FALSE:
-            return Bool(value=False)
+            return make_bool(False)
         elif t.kind == TokenType.NULL:
-            return Null()
+            return make_null()
         elif t.kind == TokenType.INT:
-            return Int(value=t.value)
+            return make_int(t.value)
         elif t.kind == TokenType.FLOAT:
             return Float(value=t.value)
         elif t.kind == TokenType.D_QUOTED:
@@ -261,7 +272,7 @@ class Parser:
                     self.bump()  # allow trailing commas
                 elif self.peek().kind == TokenType.RBRACE:
                     pass
-        return Object(value=obj_map)
+        return Object._from_nodes(obj_map)
 
     def parse_array(self):
         """Parse an array."""
@@ -276,7 +287,7 @@ class Parser:
                 # optional comma
                 if self.peek().kind == TokenType.COMMA:
                     self.bump()
-        return Array(value=items)
+        return Array._from_nodes(items)
 
 
 def token_name(k: TokenType) -> str:
@@ -89,70 +89,124 @@ def write_tag(out: list, t: Tag, fmt: Format):
 
 def write_value(out: list, v, fmt: Format, depth: int):
     """Write a value."""
-    if isinstance(v, Null):
-        out.append("null")
-    elif isinstance(v, Bool):
-        out.append("true" if v.value else "false")
-    elif isinstance(v, Int):
-        out.append(str(v.value))
-    elif isinstance(v, Float):
-        out.append(str(v.value))
-    elif isinstance(v, DecimalValue):
-        out.append('d"')
-        out.append(str(v.value))
-        out.append('"')
-    elif isinstance(v, String):
-        write_string(out, v.value)
-    elif isinstance(v, Bytes):
-        out.append('b"')
-        out.append(base64.b64encode(v.value).decode('ascii'))
-        out.append('"')
-    elif isinstance(v, DateTime):
-        out.append('t"')
-        # Format as RFC3339
-        out.append(v.value.isoformat().replace('+00:00', 'Z'))
-        out.append('"')
-    elif isinstance(v, Duration):
-        out.append('r"')
-        out.append(v.value)
-        out.append('"')
-    elif isinstance(v, Uuid):
-        out.append('u"')
-        out.append(str(v.value))
-        out.append('"')
-    elif isinstance(v, Array):
-        out.append('[')
-        if fmt.pretty and v.value:
+    try:
+        kind = v.KIND
+    except AttributeError:
+        return
+    _VALUE_WRITERS[kind](out, v, fmt, depth)
+
+
+def _write_null(out: list, v: Null, fmt: Format, depth: int):
+    """Write a null value."""
+    out.append("null")
+
+
+def _write_bool(out: list, v: Bool, fmt: Format, depth: int):
+    """Write a boolean value."""
+    out.append("true" if v.value else "false")
+
+
+def _write_number(out: list, v, fmt: Format, depth: int):
+    """Write an Int or Float value (serves both the INT and FLOAT entries)."""
+    out.append(str(v.value))
+
+
+def _write_decimal(out: list, v: DecimalValue, fmt: Format, depth: int):
+    """Write a decimal value as `d"..."`."""
+    out.append('d"')
+    out.append(str(v.value))
+    out.append('"')
+
+
+def _write_string(out: list, v: String, fmt: Format, depth: int):
+    """Write a string value."""
+    write_string(out, v.value)
+
+
+def _write_bytes(out: list, v: Bytes, fmt: Format, depth: int):
+    """Write a bytes value as Base64 `b"..."`."""
+    out.append('b"')
+    out.append(base64.b64encode(v.value).decode('ascii'))
+    out.append('"')
+
+
+def _write_datetime(out: list, v: DateTime, fmt: Format, depth: int):
+    """Write a datetime value as RFC3339 `t"..."`."""
+    out.append('t"')
+    # Format as RFC3339
+    out.append(v.value.isoformat().replace('+00:00', 'Z'))
+    out.append('"')
+
+
+def _write_duration(out: list, v: Duration, fmt: Format, depth: int):
+    """Write a duration value as `r"..."`."""
+    out.append('r"')
+    out.append(v.value)
+    out.append('"')
+
+
+def _write_uuid(out: list, v: Uuid, fmt: Format, depth: int):
+    """Write a UUID value as `u"..."`."""
+    out.append('u"')
+    out.append(str(v.value))
+    out.append('"')
+
+
+def _write_array(out: list, v: Array, fmt: Format, depth: int):
+    """Write an array value."""
+    out.append('[')
+    if fmt.pretty and v:
+        out.append('\n')
+    last = len(v) - 1
+    for i, n in enumerate(v):
+        if fmt.pretty:
+            indent(out, depth + 1, fmt.indent)
+        write_node(out, n, fmt, depth + 1)
+        if i < last or fmt.trailing_commas:
+            out.append(',')
+        if fmt.pretty:
             out.append('\n')
-        for i, n in enumerate(v.value):
-            if fmt.pretty:
-                indent(out, depth + 1, fmt.indent)
-            write_node(out, n, fmt, depth + 1)
-            if i + 1 < len(v.value) or fmt.trailing_commas:
-                out.append(',')
-            if fmt.pretty:
-                out.append('\n')
-        if fmt.pretty and v.value:
-            indent(out, depth, fmt.indent)
-        out.append(']')
-    elif isinstance(v, Object):
-        out.append('{')
-        if fmt.pretty and v.value:
+    if fmt.pretty and v:
+        indent(out, depth, fmt.indent)
+    out.append(']')
+
+
+def _write_object(out: list, v: Object, fmt: Format, depth: int):
+    """Write an object value."""
+    out.append('{')
+    if fmt.pretty and v:
+        out.append('\n')
+    last = len(v) - 1
+    for i, (k, n) in enumerate(v.items()):
+        if fmt.pretty:
+            indent(out, depth + 1, fmt.indent)
+        write_key(out, k)
+        out.append(': ')
+        write_node(out, n, fmt, depth + 1)
+        if i < last or fmt.trailing_commas:
+            out.append(',')
+        if fmt.pretty:
             out.append('\n')
-        items = list(v.value.items())
-        for i, (k, n) in enumerate(items):
-            if fmt.pretty:
-                indent(out, depth + 1, fmt.indent)
-            write_key(out, k)
-            out.append(': ')
-            write_node(out, n, fmt, depth + 1)
-            if i + 1 < len(items) or fmt.trailing_commas:
-                out.append(',')
-            if fmt.pretty:
-                out.append('\n')
-        if fmt.pretty and v.value:
-            indent(out, depth, fmt.indent)
-        out.append('}')
+    if fmt.pretty and v:
+        indent(out, depth, fmt.indent)
+    out.append('}')
+
+
+# One writer per `ValueKind`, indexed by the value's `KIND`.
+_VALUE_WRITERS = [
+    _write_null,      # NULL
+    _write_bool,      # BOOL
+    _write_number,    # INT
+    _write_number,    # FLOAT
+    _write_decimal,   # DECIMAL
+    _write_string,    # STRING
+    _write_bytes,     # BYTES
+    _write_datetime,  # DATETIME
+    _write_duration,  # DURATION
+    _write_uuid,      # UUID
+    _write_array,     # ARRAY
+    _write_object,    # OBJECT
+]
 
 
 def indent(out: list, depth: int, space: int):